@@ -0,0 +1,77 @@
+using System;
+using UnityEngine;
+using UnityEditor;
+using UnityEditor.PackageManager;
+using UnityEditor.PackageManager.Requests;
+
+namespace NeuralRink.Editor
+{
+    /// <summary>
+    /// Batchmode entry point for fix_unity_errors.py.
+    /// Runs every fix in a single editor session so Unity only cold-starts once.
+    /// Lives in its own Editor-only assembly (NeuralRink.Editor.asmdef) that references
+    /// neither Assembly-CSharp nor TextMeshPro, so it still compiles while the packages
+    /// it installs are missing.
+    /// </summary>
+    public static class FixUnityErrors
+    {
+        private static AddRequest addRequest;
+
+        /// <summary>
+        /// Import TextMeshPro essentials and add the Input System package, then exit.
+        /// Invoke without -quit: the package request completes asynchronously and
+        /// the editor exits itself once it is done.
+        /// </summary>
+        public static void Run()
+        {
+            Debug.Log("🔧 Neural Rink: Importing TextMeshPro essentials...");
+            ImportTextMeshProEssentials();
+
+            Debug.Log("📦 Neural Rink: Installing Input System...");
+            addRequest = Client.Add("com.unity.inputsystem");
+            EditorApplication.update += CheckAddPackageProgress;
+        }
+
+        /// <summary>
+        /// Call TMP_PackageResourceImporter.ImportResources through reflection, since
+        /// TextMeshPro may not be installed when this assembly compiles.
+        /// </summary>
+        private static void ImportTextMeshProEssentials()
+        {
+            foreach (var assembly in AppDomain.CurrentDomain.GetAssemblies())
+            {
+                var importer = assembly.GetType("TMPro.TMP_PackageResourceImporter");
+                var importResources = importer?.GetMethod("ImportResources", new[] { typeof(bool), typeof(bool), typeof(bool) });
+                if (importResources != null)
+                {
+                    // importEssentials, importExamples, interactive
+                    importResources.Invoke(null, new object[] { true, false, false });
+                    return;
+                }
+            }
+
+            Debug.LogWarning("⚠️ TextMeshPro importer not found; skipping the essentials import");
+        }
+
+        /// <summary>
+        /// Wait for the package add request and exit with its status.
+        /// </summary>
+        private static void CheckAddPackageProgress()
+        {
+            if (addRequest == null || !addRequest.IsCompleted) return;
+
+            EditorApplication.update -= CheckAddPackageProgress;
+
+            if (addRequest.Status == StatusCode.Success)
+            {
+                Debug.Log($"✅ Successfully installed package: {addRequest.Result.name}");
+                EditorApplication.Exit(0);
+            }
+            else
+            {
+                Debug.LogError($"❌ Failed to install package: {addRequest.Error.message}");
+                EditorApplication.Exit(1);
+            }
+        }
+    }
+}
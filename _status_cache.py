@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Shared filesystem index for the Neural Rink status scripts
+Walks the project roots once so existence checks become in-memory lookups
+"""
+
+import json
+import os
+import stat
+import time
+
+# Only the trees the scripts look things up in; builds/ and results/ can hold tens of
+# thousands of files and are cheaper to stat or list on demand
+INDEX_ROOTS = ("Assets", "Packages")
+INDEX_TTL = 30.0  # Seconds before the index is considered stale
+MAX_ENTRIES = 100_000  # Give up on indexing (and just stat) past this many entries
+
+# Directory listings persisted between runs, so the scripts reuse each other's walks
+CACHE_FILE = ".neuralrink_cache.json"
+CACHE_VERSION = 1
+RACY_WINDOW_NS = 2_000_000_000  # Listings this close to the save time may have been missed
+
+# Directory path -> names of its entries, for every directory under INDEX_ROOTS
+_children = None
+_entries = None
+_built_at = None
+_cache_file = CACHE_FILE
+
+def _valid_listing(listing):
+    """True if a cached listing has the shape walk_root expects"""
+    return (isinstance(listing, dict)
+            and isinstance(listing.get("mtime"), int)
+            and all(isinstance(listing.get(key), list)
+                    and all(isinstance(name, str) for name in listing[key])
+                    for key in ("names", "dirs")))
+
+def load(cache_file=CACHE_FILE):
+    """Load persisted directory listings, keeping only those safe to reuse"""
+    try:
+        with open(cache_file) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # Anything unexpected just means a fresh walk
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    dirs = data.get("dirs")
+    saved_at = data.get("saved_at")
+    if not isinstance(dirs, dict) or not isinstance(saved_at, int):
+        return {}
+    
+    # A directory changed in the same timestamp tick as the save would look unchanged
+    # (the "racy git" problem), so listings recorded that close to it are rescanned
+    cutoff = saved_at - RACY_WINDOW_NS
+    return {path: listing for path, listing in dirs.items()
+            if _valid_listing(listing) and listing["mtime"] < cutoff}
+
+def save(listings, cache_file=CACHE_FILE):
+    """Persist directory listings; failures only cost the next run a fresh walk"""
+    data = {"version": CACHE_VERSION, "saved_at": time.time_ns(), "dirs": listings}
+    tmp_path = cache_file + ".tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        pass
+
+def walk_root(root, cached, listings, budget=MAX_ENTRIES):
+    """
+    Collect the listing of root and every directory below it into listings
+    A directory whose mtime matches its cached listing costs one stat instead of a scandir
+    Returns the remaining entry budget; negative means the walk stopped early
+    """
+    try:
+        mtime = os.stat(root, follow_symlinks=False).st_mtime_ns
+    except OSError:
+        return budget
+    
+    listing = cached.get(root)
+    if listing is None or listing["mtime"] != mtime:
+        names, dirs = [], []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    names.append(entry.name)
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.name)
+        except OSError:
+            pass
+        listing = {"mtime": mtime, "names": names, "dirs": dirs}
+    
+    listings[root] = listing
+    budget -= len(listing["names"])
+    for name in listing["dirs"]:
+        if budget < 0:
+            break
+        budget = walk_root(os.path.join(root, name), cached, listings, budget)
+    return budget
+
+def build_index(roots=INDEX_ROOTS, cache_file=CACHE_FILE):
+    """Walk roots once (reusing unchanged listings from cache_file) and index every path"""
+    global _children, _entries, _built_at, _cache_file
+    _cache_file = cache_file
+
+    cached = load(cache_file) if cache_file else {}
+    listings = {}
+    budget = MAX_ENTRIES
+    for root in roots:
+        root = os.path.normpath(root)
+        if os.path.isdir(root):
+            budget = walk_root(root, cached, listings, budget)
+        if budget < 0:
+            # Too big to be worth caching; fall back to direct stats until the TTL expires
+            _children, _entries = None, None
+            _built_at = time.monotonic()
+            return False
+
+    children = {}
+    entries = set(listings)
+    for path, listing in listings.items():
+        children[path] = listing["names"]
+        entries.update(os.path.join(path, name) for name in listing["names"])
+
+    if cache_file and listings != cached:
+        save(listings, cache_file)
+
+    _children, _entries = children, entries
+    _built_at = time.monotonic()
+    return True
+
+def add_cache_argument(parser):
+    """Add the --cache-file option shared by the status scripts to an argparse parser"""
+    parser.add_argument("--cache-file", default=CACHE_FILE,
+                       help="Directory listing cache shared with the other status scripts ('' disables it)")
+
+def count_files(dirpath, suffix):
+    """Count regular files in dirpath ending with suffix, in one scandir pass"""
+    count = 0
+    with os.scandir(dirpath) as entries:
+        for entry in entries:
+            # Name test first: non-matching entries never need their file type
+            if entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False):
+                count += 1
+    return count
+
+def _lstat(path):
+    """One lstat() for paths outside the index; None if missing (no Path object, no symlink chase)"""
+    try:
+        return os.stat(path, follow_symlinks=False)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+def _indexed(path):
+    """Return the normalised path if it falls under an indexed root, else None"""
+    if _built_at is None or time.monotonic() - _built_at > INDEX_TTL:
+        build_index(cache_file=_cache_file)
+    if _children is None:
+        return None
+    path = os.path.normpath(path)
+    root = path.split(os.sep, 1)[0]
+    return path if root in INDEX_ROOTS else None
+
+def exists(path):
+    """os.path.exists answered from the index where possible"""
+    key = _indexed(path)
+    if key is None:
+        return _lstat(path) is not None
+    return key in _entries
+
+def missing(paths):
+    """Return the paths that don't exist, listing each parent once when they aren't indexed"""
+    parents = {}
+    result = []
+    for path in paths:
+        key = _indexed(path)
+        if key is not None:
+            if key not in _entries:
+                result.append(path)
+            continue
+        parent, name = os.path.split(os.path.normpath(path))
+        if parent not in parents:
+            try:
+                parents[parent] = set(os.listdir(parent or "."))
+            except OSError:
+                parents[parent] = set()
+        if name not in parents[parent]:
+            result.append(path)
+    return result
+
+def isdir(path):
+    """os.path.isdir answered from the index where possible"""
+    key = _indexed(path)
+    if key is None:
+        st = _lstat(path)
+        return st is not None and stat.S_ISDIR(st.st_mode)
+    return key in _children
+
+def listdir(path):
+    """os.listdir answered from the index where possible"""
+    key = _indexed(path)
+    if key is None:
+        return os.listdir(path)
+    if key not in _children:
+        raise FileNotFoundError(path)
+    return list(_children[key])
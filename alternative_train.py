@@ -6,15 +6,39 @@ Uses Stable-Baselines3 instead of ML-Agents for Python 3.13 compatibility
 
 import os
 import sys
+import math
 import argparse
+import functools
+from multiprocessing import shared_memory
 import numpy as np
 import torch
 import gymnasium as gym
 from stable_baselines3 import PPO
 from stable_baselines3.common.env_util import make_vec_env
+from stable_baselines3.common.vec_env import SubprocVecEnv, VecEnv, VecMonitor
 from stable_baselines3.common.callbacks import EvalCallback, StopTrainingOnRewardThreshold
 import matplotlib.pyplot as plt
 
+# Numba is optional - HockeyVecEnv falls back to plain NumPy without it
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+OBS_DIM = 12  # 12 observations as defined in GoalieAgent
+MAX_EPISODE_STEPS = 300  # 6 seconds at 50 FPS
+
+# Goalie crease bounds (X, Z) used to clip goalie position every step
+_CLIP_LO = np.array([-2.0, -1.5], dtype=np.float32)
+_CLIP_HI = np.array([2.0, 1.5], dtype=np.float32)
+
+# Episode result codes used by the batched env (0 = still running)
+RESULT_NAMES = ('', 'miss', 'goal', 'save', 'timeout')
+RESULT_MISS, RESULT_GOAL, RESULT_SAVE, RESULT_TIMEOUT = 1, 2, 3, 4
+# Terminal reward for each result code (replaces the positioning reward)
+RESULT_REWARDS = np.array([0.0, 50.0, -200.0, 200.0, -10.0], dtype=np.float32)
+
 def create_hockey_environment():
     """
     Create a simplified hockey environment for training
@@ -33,10 +57,13 @@ def create_hockey_environment():
             self.observation_space = gym.spaces.Box(
                 low=-np.inf,
                 high=np.inf,
-                shape=(12,),  # 12 observations as defined in GoalieAgent
+                shape=(OBS_DIM,),
                 dtype=np.float32
             )
             
+            # Observation buffer filled in place by _get_observation
+            self._obs = np.zeros(OBS_DIM, dtype=np.float32)
+            
             self.reset()
         
         def reset(self, seed=None, options=None):
@@ -45,9 +72,9 @@ def create_hockey_environment():
             self.goalie_pos = np.array([0.0, 0.0])
             self.puck_pos = np.array([-5.0, 0.0])
             # Puck starts with velocity toward goal (simulating a shot)
-            self.puck_vel = np.array([2.0, np.random.uniform(-0.5, 0.5)])
+            self.puck_vel = np.array([2.0, self.np_random.uniform(-0.5, 0.5)])
             self.episode_step = 0
-            self.max_steps = 300  # 6 seconds at 50 FPS
+            self.max_steps = MAX_EPISODE_STEPS
             self.puck_shot = False
             
             return self._get_observation(), {}
@@ -55,7 +82,7 @@ def create_hockey_environment():
         def step(self, action):
             # Apply action (goal movement)
             self.goalie_pos += action * 0.1  # Scale movement
-            self.goalie_pos = np.clip(self.goalie_pos, [-2.0, -1.5], [2.0, 1.5])
+            np.clip(self.goalie_pos, _CLIP_LO, _CLIP_HI, out=self.goalie_pos)
             
             # Update puck physics (simplified)
             self.puck_pos += self.puck_vel * 0.02  # 50 FPS timestep
@@ -67,8 +94,10 @@ def create_hockey_environment():
             info = {}
             
             # Intermediate reward: stay close to puck (encourages positioning)
-            distance_to_puck = np.linalg.norm(self.puck_pos - self.goalie_pos)
-            reward += max(0, 10 - distance_to_puck) * 0.1  # Small positive reward for being close
+            dx = self.puck_pos[0] - self.goalie_pos[0]
+            dz = self.puck_pos[1] - self.goalie_pos[1]
+            distance_sq = dx * dx + dz * dz
+            reward += max(0, 10 - math.sqrt(distance_sq)) * 0.1  # Small positive reward for being close
             
             # Check for end conditions
             if abs(self.puck_pos[0]) > 8:  # Out of bounds (miss)
@@ -79,7 +108,7 @@ def create_hockey_environment():
                 reward = -200  # Goal penalty
                 done = True
                 info['result'] = 'goal'
-            elif self._check_save():  # Save
+            elif self._check_save(distance_sq):  # Save
                 reward = 200  # Save bonus
                 done = True
                 info['result'] = 'save'
@@ -95,22 +124,18 @@ def create_hockey_environment():
         
         def _get_observation(self):
             """Get current observation vector"""
-            return np.array([
-                self.goalie_pos[0],  # Goalie X position
-                self.goalie_pos[1],  # Goalie Z position
-                self.puck_pos[0],    # Puck X position
-                self.puck_pos[1],    # Puck Z position
-                self.puck_vel[0],    # Puck X velocity
-                self.puck_vel[1],    # Puck Z velocity
-                0.0, 0.0, 0.0, 0.0, 0.0, 0.0  # Placeholder for other observations
-            ], dtype=np.float32)
+            self._obs[0:2] = self.goalie_pos  # Goalie X, Z position
+            self._obs[2:4] = self.puck_pos    # Puck X, Z position
+            self._obs[4:6] = self.puck_vel    # Puck X, Z velocity
+            # _obs[6:12] are placeholders for other observations
+            # Callers keep the returned array (e.g. as terminal_observation), so return a copy
+            return self._obs.copy()
         
-        def _check_save(self):
-            """Check if goalie made a save"""
-            distance = np.linalg.norm(self.puck_pos - self.goalie_pos)
+        def _check_save(self, distance_sq):
+            """Check if goalie made a save (distance_sq: squared goalie-puck distance)"""
             # Save if close enough AND puck is in goal area
             in_goal_area = self.puck_pos[0] > 6 and abs(self.puck_pos[1]) < 1.0
-            return distance < 1.0 and in_goal_area
+            return distance_sq < 1.0 and in_goal_area
         
         def render(self, mode='human'):
             """Simple text rendering"""
@@ -118,26 +143,325 @@ def create_hockey_environment():
     
     return HockeyEnv()
 
-def train_goalie(run_id="neural_rink_alt", max_steps=100000, save_freq=10000):
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _step_kernel(goalie_pos, puck_pos, puck_vel, episode_step, actions, out_reward, out_result):
+        """Advance every env of HockeyVecEnv by one step in place"""
+        for i in prange(goalie_pos.shape[0]):
+            # Apply action (goalie movement) and clamp to the crease
+            gx = goalie_pos[i, 0] + actions[i, 0] * 0.1
+            gz = goalie_pos[i, 1] + actions[i, 1] * 0.1
+            gx = min(max(gx, -2.0), 2.0)
+            gz = min(max(gz, -1.5), 1.5)
+            goalie_pos[i, 0] = gx
+            goalie_pos[i, 1] = gz
+            
+            # Update puck physics (simplified)
+            px = puck_pos[i, 0] + puck_vel[i, 0] * 0.02
+            pz = puck_pos[i, 1] + puck_vel[i, 1] * 0.02
+            puck_pos[i, 0] = px
+            puck_pos[i, 1] = pz
+            puck_vel[i, 0] *= 0.99
+            puck_vel[i, 1] *= 0.99
+            
+            dx = px - gx
+            dz = pz - gz
+            distance_sq = dx * dx + dz * dz
+            
+            # Check for end conditions
+            result = 0
+            episode_step[i] += 1
+            if episode_step[i] >= MAX_EPISODE_STEPS:
+                result = RESULT_TIMEOUT
+            elif abs(px) > 8:
+                result = RESULT_MISS
+            elif abs(pz) < 0.5 and px > 7:
+                result = RESULT_GOAL
+            elif distance_sq < 1.0 and px > 6 and abs(pz) < 1.0:
+                result = RESULT_SAVE
+            
+            # Terminal reward, otherwise reward staying close to the puck
+            if result != 0:
+                out_reward[i] = RESULT_REWARDS[result]
+            else:
+                out_reward[i] = max(0.0, 10.0 - np.sqrt(distance_sq)) * 0.1
+            out_result[i] = result
+
+class HockeyVecEnv(VecEnv):
+    """
+    Batched version of HockeyEnv exposed through the SB3 VecEnv interface
+    State is kept as (num_envs, 2) arrays so every step is a handful of NumPy ops
+    over all episodes instead of one Python env.step per episode
+    """
+    def __init__(self, num_envs, seed=None):
+        observation_space = gym.spaces.Box(
+            low=-np.inf,
+            high=np.inf,
+            shape=(OBS_DIM,),
+            dtype=np.float32
+        )
+        action_space = gym.spaces.Box(
+            low=np.array([-1, -1]),  # X, Z movement
+            high=np.array([1, 1]),
+            dtype=np.float32
+        )
+        self.render_mode = None
+        super().__init__(num_envs, observation_space, action_space)
+        
+        self._rng = np.random.default_rng(seed)
+        self.goalie_pos = np.zeros((num_envs, 2), dtype=np.float32)
+        self.puck_pos = np.zeros((num_envs, 2), dtype=np.float32)
+        self.puck_vel = np.zeros((num_envs, 2), dtype=np.float32)
+        self.episode_step = np.zeros(num_envs, dtype=np.int32)
+        self._actions = np.zeros((num_envs, 2), dtype=np.float32)
+        self._rewards = np.zeros(num_envs, dtype=np.float32)
+        self._results = np.zeros(num_envs, dtype=np.int8)
+        self._obs = np.zeros((num_envs, OBS_DIM), dtype=np.float32)
+    
+    def _reset_envs(self, idx):
+        """Start a new shot for the envs in idx"""
+        self.goalie_pos[idx] = 0.0
+        self.puck_pos[idx] = (-5.0, 0.0)
+        # Puck starts with velocity toward goal (simulating a shot)
+        self.puck_vel[idx, 0] = 2.0
+        self.puck_vel[idx, 1] = self._rng.uniform(-0.5, 0.5, size=len(idx))
+        self.episode_step[idx] = 0
+    
+    def _get_observation(self):
+        """Get current (num_envs, 12) observation batch"""
+        self._obs[:, 0:2] = self.goalie_pos
+        self._obs[:, 2:4] = self.puck_pos
+        self._obs[:, 4:6] = self.puck_vel
+        # SB3 stores the previous batch as _last_obs, so it must not alias the buffer
+        return self._obs.copy()
+    
+    def reset(self):
+        self._reset_envs(np.arange(self.num_envs))
+        return self._get_observation()
+    
+    def step_async(self, actions):
+        self._actions[:] = actions
+    
+    def step_wait(self):
+        if NUMBA_AVAILABLE:
+            _step_kernel(self.goalie_pos, self.puck_pos, self.puck_vel, self.episode_step,
+                         self._actions, self._rewards, self._results)
+        else:
+            self._step_numpy()
+        
+        # SB3 keeps references to the returned arrays, so hand out copies
+        rewards = self._rewards.copy()
+        dones = self._results != 0
+        obs = self._get_observation()
+        
+        # Auto-reset finished episodes, keeping their last observation for SB3
+        infos = [{} for _ in range(self.num_envs)]
+        done_idx = np.flatnonzero(dones)
+        if done_idx.size:
+            for i in done_idx:
+                infos[i]['result'] = RESULT_NAMES[self._results[i]]
+                infos[i]['terminal_observation'] = obs[i]
+            self._reset_envs(done_idx)
+            obs = self._get_observation()
+        
+        return obs, rewards, dones, infos
+    
+    def _step_numpy(self):
+        """NumPy equivalent of _step_kernel"""
+        # Apply actions and update puck physics for every env at once
+        self.goalie_pos += self._actions * 0.1
+        np.clip(self.goalie_pos, _CLIP_LO, _CLIP_HI, out=self.goalie_pos)
+        self.puck_pos += self.puck_vel * 0.02
+        self.puck_vel *= 0.99
+        
+        delta = self.puck_pos - self.goalie_pos
+        distance_sq = np.einsum('ij,ij->i', delta, delta)
+        
+        # End conditions; np.select keeps HockeyEnv.step's priority (timeout overrides the rest)
+        puck_x = self.puck_pos[:, 0]
+        puck_z = np.abs(self.puck_pos[:, 1])
+        self.episode_step += 1
+        self._results[:] = np.select(
+            [self.episode_step >= MAX_EPISODE_STEPS,
+             np.abs(puck_x) > 8,
+             (puck_z < 0.5) & (puck_x > 7),
+             (distance_sq < 1.0) & (puck_x > 6) & (puck_z < 1.0)],
+            [RESULT_TIMEOUT, RESULT_MISS, RESULT_GOAL, RESULT_SAVE],
+            0
+        )
+        
+        # Terminal reward where an episode ended, otherwise reward staying close to the puck
+        np.copyto(self._rewards, np.where(self._results != 0,
+                                          RESULT_REWARDS[self._results],
+                                          np.maximum(0.0, 10.0 - np.sqrt(distance_sq)) * 0.1))
+    
+    def seed(self, seed=None):
+        self._rng = np.random.default_rng(seed)
+        return [seed] * self.num_envs
+    
+    def close(self):
+        pass
+    
+    def get_attr(self, attr_name, indices=None):
+        return [getattr(self, attr_name) for _ in self._get_indices(indices)]
+    
+    def set_attr(self, attr_name, value, indices=None):
+        setattr(self, attr_name, value)
+    
+    def env_method(self, method_name, *method_args, indices=None, **method_kwargs):
+        method = getattr(self, method_name)
+        return [method(*method_args, **method_kwargs) for _ in self._get_indices(indices)]
+    
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        return [False for _ in self._get_indices(indices)]
+
+class SharedObservationWrapper(gym.Wrapper):
+    """
+    Worker-side wrapper for SharedMemoryVecEnv
+    Writes every observation into this env's row of a shared memory block and sends None
+    through the pipe instead; only terminal observations are still pickled
+    """
+    def __init__(self, env, shm_name, index):
+        super().__init__(env)
+        self._shm = shared_memory.SharedMemory(name=shm_name)
+        self._row = np.ndarray((OBS_DIM,), dtype=np.float32, buffer=self._shm.buf,
+                               offset=index * OBS_DIM * np.dtype(np.float32).itemsize)
+    
+    def reset(self, **kwargs):
+        obs, info = self.env.reset(**kwargs)
+        self._row[:] = obs
+        return None, info
+    
+    def step(self, action):
+        obs, reward, terminated, truncated, info = self.env.step(action)
+        self._row[:] = obs
+        # SubprocVecEnv stores the returned observation as terminal_observation
+        return (obs if terminated or truncated else None), reward, terminated, truncated, info
+    
+    def close(self):
+        super().close()
+        self._row = None
+        self._shm.close()
+
+def _make_shared_observation_env(env_fn, shm_name, index):
+    return SharedObservationWrapper(env_fn(), shm_name, index)
+
+class SharedMemoryVecEnv(SubprocVecEnv):
+    """
+    SubprocVecEnv whose workers return observations through shared memory
+    Avoids pickling an observation per env per step; rewards, dones and infos still use the pipes
+    """
+    def __init__(self, env_fns, start_method=None):
+        n_envs = len(env_fns)
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=n_envs * OBS_DIM * np.dtype(np.float32).itemsize
+        )
+        self._obs = np.ndarray((n_envs, OBS_DIM), dtype=np.float32, buffer=self._shm.buf)
+        env_fns = [functools.partial(_make_shared_observation_env, env_fn, self._shm.name, i)
+                   for i, env_fn in enumerate(env_fns)]
+        super().__init__(env_fns, start_method)
+    
+    def step_wait(self):
+        results = [remote.recv() for remote in self.remotes]
+        self.waiting = False
+        _, rewards, dones, infos, self.reset_infos = zip(*results)
+        # Copy out of the shared block: SB3 keeps the previous batch as _last_obs
+        return self._obs.copy(), np.stack(rewards), np.stack(dones), infos
+    
+    def reset(self):
+        for env_idx, remote in enumerate(self.remotes):
+            remote.send(("reset", (self._seeds[env_idx], self._options[env_idx])))
+        results = [remote.recv() for remote in self.remotes]
+        _, self.reset_infos = zip(*results)
+        # Seeds and options are only used once
+        self._reset_seeds()
+        self._reset_options()
+        return self._obs.copy()
+    
+    def close(self):
+        if self.closed:
+            return
+        super().close()
+        self._obs = None
+        self._shm.close()
+        self._shm.unlink()
+
+class DeterministicActor(torch.nn.Module):
+    """
+    Deterministic action path of a trained MlpPolicy: features -> actor MLP -> action mean
+    Equivalent to model.predict(obs, deterministic=True) before clipping to the action space
+    """
+    def __init__(self, policy):
+        super().__init__()
+        self.features_extractor = policy.pi_features_extractor
+        self.mlp_extractor = policy.mlp_extractor
+        self.action_net = policy.action_net
+    
+    def forward(self, obs):
+        latent_pi = self.mlp_extractor.forward_actor(self.features_extractor(obs))
+        return self.action_net(latent_pi)
+
+def export_policy(model, path):
+    """
+    Trace the deterministic goalie policy to TorchScript, specialized for one (1, 12)
+    observation, and save it to path
+    """
+    actor = DeterministicActor(model.policy).eval()
+    traced = torch.jit.trace(actor, torch.zeros(1, OBS_DIM, device=model.device))
+    traced = torch.jit.optimize_for_inference(traced)
+    torch.jit.save(traced, path)
+    return traced
+
+class GoaliePPO(PPO):
+    """
+    PPO that collects rollouts with autograd disabled end to end
+    no_grad rather than inference_mode: tensors created here may be reused by train()
+    """
+    def collect_rollouts(self, *args, **kwargs):
+        with torch.no_grad():
+            return super().collect_rollouts(*args, **kwargs)
+
+def train_goalie(run_id="neural_rink_alt", max_steps=100000, save_freq=10000, n_envs=None,
+                 vec_env="batched", compile_policy=False, device="auto"):
     """
     Train the goalie using Stable-Baselines3 PPO
+    Rollouts are collected from n_envs episodes (defaults to one per CPU core), either
+    stepped together in-process (batched) or one worker process per env (subproc, with
+    observations returned through shared memory)
     """
+    n_envs = n_envs or os.cpu_count() or 1
+    
     print(f"🏒 Starting Neural Rink Training (Alternative Method)")
     print(f"Run ID: {run_id}")
     print(f"Max Steps: {max_steps}")
+    print(f"Parallel Envs: {n_envs}")
     print("=" * 50)
     
-    # Create environment
-    env = create_hockey_environment()
+    # Create vectorized training environment
+    if vec_env == "subproc":
+        env = make_vec_env(create_hockey_environment, n_envs=n_envs, vec_env_cls=SharedMemoryVecEnv)
+    else:
+        env = VecMonitor(HockeyVecEnv(n_envs))
+    
+    # Separate single env for evaluation and the post-training test
+    eval_env = create_hockey_environment()
+    
+    # Create results directory before PPO so the TensorBoard log dir already exists
+    os.makedirs(f"./results/{run_id}", exist_ok=True)
     
     # Create PPO model
-    model = PPO(
+    # n_steps is per env, so split the 2048-step rollout across the workers, rounding it
+    # so the full rollout (n_steps * n_envs) is still a whole number of mini-batches
+    batch_size = 64
+    step = batch_size // math.gcd(batch_size, n_envs)
+    n_steps = max(2048 // n_envs // step * step, step)
+    model = GoaliePPO(
         "MlpPolicy",
         env,
         verbose=1,
         learning_rate=3e-4,
-        n_steps=2048,
-        batch_size=64,
+        n_steps=n_steps,
+        batch_size=batch_size,
         n_epochs=10,
         gamma=0.99,
         gae_lambda=0.95,
@@ -145,18 +469,18 @@ def train_goalie(run_id="neural_rink_alt", max_steps=100000, save_freq=10000):
         ent_coef=0.01,
         vf_coef=0.5,
         max_grad_norm=0.5,
+        device=device,
         tensorboard_log=f"./results/{run_id}/"
     )
     
-    # Create results directory
-    os.makedirs(f"./results/{run_id}", exist_ok=True)
-    
     # Setup callbacks
     eval_callback = EvalCallback(
-        env,
+        eval_env,
         best_model_save_path=f"./results/{run_id}/best_model",
         log_path=f"./results/{run_id}/eval_logs",
-        eval_freq=save_freq,
+        # eval_freq counts vectorized steps, i.e. n_envs timesteps each
+        eval_freq=max(save_freq // n_envs, 1),
+        n_eval_episodes=5,
         deterministic=True,
         render=False
     )
@@ -166,34 +490,68 @@ def train_goalie(run_id="neural_rink_alt", max_steps=100000, save_freq=10000):
     model.learn(
         total_timesteps=max_steps,
         callback=eval_callback,
+        tb_log_name=run_id,
+        reset_num_timesteps=False,
         progress_bar=True
     )
     
     # Save final model
     model.save(f"./results/{run_id}/final_model")
     print(f"✅ Training complete! Model saved to ./results/{run_id}/")
+    env.close()
+    
+    # Export the policy once and run the test episodes on it directly,
+    # bypassing SB3's per-call predict() overhead
+    actor = export_policy(model, f"./results/{run_id}/goalie_policy.pt")
+    print(f"📦 TorchScript policy exported to ./results/{run_id}/goalie_policy.pt")
+    if compile_policy:
+        actor = torch.compile(DeterministicActor(model.policy).eval(), mode="reduce-overhead")
     
     # Test the trained model
+    test_goalie(actor, eval_env, model.device)
+    
+    return model
+
+@torch.inference_mode()
+def test_goalie(actor, env, device="cpu", episodes=10):
+    """
+    Run test episodes on a single HockeyEnv and report the average reward
+    actor maps a (1, 12) observation tensor on device to an action (see DeterministicActor)
+    """
     print("\n🧪 Testing trained model...")
-    obs, _ = env.reset()
+    device = torch.device(device)
+    actor(torch.zeros(1, OBS_DIM, device=device))  # Warmup (triggers compilation with --compile)
+    
+    # Per-step buffers reused across episodes (episodes end by MAX_EPISODE_STEPS).
+    # On CUDA the observation buffer is pinned so each row can be copied to the GPU asynchronously
+    on_gpu = device.type == "cuda"
+    obs_host = torch.empty((MAX_EPISODE_STEPS, OBS_DIM), dtype=torch.float32, pin_memory=on_gpu)
+    obs_device = torch.empty((1, OBS_DIM), device=device) if on_gpu else None
+    obs_buf = obs_host.numpy()
+    action_buf = np.empty((MAX_EPISODE_STEPS, 2), dtype=np.float32)
+    reward_buf = np.empty(MAX_EPISODE_STEPS, dtype=np.float64)
     total_reward = 0
     
-    for i in range(10):  # Test 10 episodes
+    for i in range(episodes):
         obs, _ = env.reset()
-        episode_reward = 0
         
-        while True:
-            action, _ = model.predict(obs, deterministic=True)
-            obs, reward, done, truncated, info = env.step(action)
-            episode_reward += reward
-            
+        for t in range(MAX_EPISODE_STEPS):
+            np.copyto(obs_buf[t], obs)
+            obs_in = obs_host[t:t + 1]
+            if on_gpu:
+                obs_in = obs_device.copy_(obs_in, non_blocking=True)
+            action_buf[t] = actor(obs_in)[0].cpu().numpy()
+            np.clip(action_buf[t], env.action_space.low, env.action_space.high, out=action_buf[t])
+            obs, reward_buf[t], done, truncated, info = env.step(action_buf[t])
             if done or truncated:
-                result = info.get('result', 'timeout')
-                print(f"Episode {i+1}: {result.upper()} (Reward: {episode_reward:.1f})")
-                total_reward += episode_reward
                 break
+        
+        episode_reward = reward_buf[:t + 1].sum()
+        result = info.get('result', 'timeout')
+        print(f"Episode {i+1}: {result.upper()} (Reward: {episode_reward:.1f})")
+        total_reward += episode_reward
     
-    avg_reward = total_reward / 10
+    avg_reward = total_reward / episodes
     print(f"\n📊 Average Test Reward: {avg_reward:.1f}")
     
     if avg_reward > 100:
@@ -203,18 +561,25 @@ def train_goalie(run_id="neural_rink_alt", max_steps=100000, save_freq=10000):
     else:
         print("📚 Goalie needs more training!")
     
-    return model
+    return avg_reward
 
 def main():
     parser = argparse.ArgumentParser(description="Train Neural Rink Goalie (Alternative Method)")
     parser.add_argument("--run-id", default="neural_rink_alt", help="Training run identifier")
     parser.add_argument("--max-steps", type=int, default=100000, help="Maximum training steps")
     parser.add_argument("--save-freq", type=int, default=10000, help="Model save frequency")
+    parser.add_argument("--n-envs", type=int, default=None, help="Parallel training environments (default: CPU count)")
+    parser.add_argument("--vec-env", choices=["batched", "subproc"], default="batched",
+                       help="Step envs as one NumPy batch or in separate worker processes")
+    parser.add_argument("--compile", action="store_true",
+                       help="Run the test episodes on a torch.compile'd policy instead of TorchScript")
+    parser.add_argument("--device", default="auto", help="Torch device for the policy (auto, cpu, cuda)")
     
     args = parser.parse_args()
     
     try:
-        model = train_goalie(args.run_id, args.max_steps, args.save_freq)
+        model = train_goalie(args.run_id, args.max_steps, args.save_freq, args.n_envs, args.vec_env,
+                             args.compile, args.device)
         print("\n🎯 Training completed successfully!")
         print(f"📈 View results: tensorboard --logdir ./results/{args.run_id}/")
         
@@ -13,12 +13,20 @@ Examples:
 """
 
 import argparse
+import json
 import os
 import sys
 import subprocess
 import shutil
+import tarfile
+from datetime import datetime
 from pathlib import Path
-import time
+
+# zstandard is optional; without it --compress falls back to ZIP / TAR.GZ
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 def main():
     parser = argparse.ArgumentParser(description='Build Neural Rink for different platforms and scenes')
@@ -51,7 +59,9 @@ def main():
     parser.add_argument('--clean', action='store_true',
                        help='Clean build directory before building')
     parser.add_argument('--compress', action='store_true',
-                       help='Compress builds after creation')
+                       help='Compress builds after creation (.tar.zst when zstandard is installed)')
+    parser.add_argument('--legacy-zip', action='store_true',
+                       help='Compress to ZIP / TAR.GZ instead of multithreaded zstd')
     parser.add_argument('--verbose', action='store_true',
                        help='Verbose build output')
     
@@ -156,27 +166,34 @@ def build_platform_scene(platform, scene, args):
     # Build Unity command
     unity_cmd = build_unity_command(args, build_target, scene_path, output_path)
     
-    # Execute build
-    try:
-        result = subprocess.run(unity_cmd, check=True, capture_output=True, text=True)
-        
-        if args.verbose:
-            print(f"Build output: {result.stdout}")
-        
-        print(f"✓ Successfully built {scene} for {platform}")
-        
-        # Compress if requested
-        if args.compress:
-            compress_build(output_path, platform)
-            
-    except subprocess.CalledProcessError as e:
+    # Execute build, streaming Unity's log to disk instead of buffering it in memory
+    log_path = os.path.join(args.output_dir, f"NeuralRink_{scene}_{platform}.log")
+    returncode = run_streaming(unity_cmd, log_path, echo=args.verbose)
+    
+    if returncode != 0:
         print(f"✗ Failed to build {scene} for {platform}")
-        if args.verbose:
-            print(f"Error output: {e.stderr}")
+        print(f"  See build log: {log_path}")
         return False
     
+    print(f"✓ Successfully built {scene} for {platform}")
+    
+    # Compress if requested
+    if args.compress:
+        compress_build(output_path, platform, args.legacy_zip)
+    
     return True
 
+def run_streaming(cmd, log_path, echo=False):
+    """Run a command, writing its combined output to log_path line by line."""
+    with open(log_path, 'w') as log_file, \
+            subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                             text=True, bufsize=1) as proc:
+        for line in proc.stdout:
+            log_file.write(line)
+            if echo:
+                sys.stdout.write(line)
+        return proc.wait()
+
 def get_build_target(platform):
     """Get Unity build target for platform."""
     targets = {
@@ -215,9 +232,8 @@ def build_unity_command(args, build_target, scene_path, output_path):
     elif args.headless:
         cmd.append('-headless')
     
-    # Add logging
-    if args.verbose:
-        cmd.extend(['-logFile', '-'])
+    # Log to stdout; build_platform_scene streams it into a per-build log file
+    cmd.extend(['-logFile', '-'])
     
     # Add custom build method
     cmd.extend(['-executeMethod', 'NeuralRink.Build.BuildScript.BuildGame'])
@@ -227,12 +243,20 @@ def build_unity_command(args, build_target, scene_path, output_path):
     
     return cmd
 
-def compress_build(output_path, platform):
+def compress_build(output_path, platform, legacy_zip=False):
     """Compress build for distribution."""
     print(f"Compressing {platform} build...")
     
     try:
-        if platform == 'Windows':
+        if zstandard is not None and not legacy_zip:
+            # Create TAR.ZST using all cores (much faster than single-threaded DEFLATE)
+            archive_path = output_path + '.tar.zst'
+            compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+            with open(archive_path, 'wb') as f, \
+                    compressor.stream_writer(f) as writer, \
+                    tarfile.open(fileobj=writer, mode='w|') as tar:
+                tar.add(output_path, arcname=os.path.basename(output_path))
+        elif platform == 'Windows':
             # Create ZIP archive for Windows
             archive_path = output_path + '.zip'
             shutil.make_archive(output_path, 'zip', output_path)
@@ -266,7 +290,7 @@ def post_build_tasks(args):
 def create_build_info(args):
     """Create build information file."""
     build_info = {
-        'build_time': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'build_time': datetime.now().isoformat(timespec='seconds'),
         'platforms': get_build_platforms(args),
         'scenes': get_build_scenes(args),
         'development_build': args.development,
@@ -277,12 +301,27 @@ def create_build_info(args):
     
     build_info_path = os.path.join(args.output_dir, 'build_info.json')
     
-    import json
     with open(build_info_path, 'w') as f:
         json.dump(build_info, f, indent=2)
     
     print(f"Build info saved to: {build_info_path}")
 
+def link_or_copy(src, dst, copy_function=shutil.copy2):
+    """
+    Hardlink src to dst (a file or directory), falling back to copy_function if linking fails.
+    Only for build output: a hardlinked source file would change along with any in-place edit of its copy.
+    """
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device (EXDEV) or a filesystem without hardlink support
+        copy_function(src, dst)
+    return dst
+
 def copy_training_models(args):
     """Copy trained models to build directory."""
     models_dir = Path('models')
@@ -292,7 +331,8 @@ def copy_training_models(args):
         
         # Copy all model files
         for model_file in models_dir.glob('*.onnx'):
-            shutil.copy2(model_file, build_models_dir)
+            # Models don't need copy2's permission/timestamp metadata
+            link_or_copy(model_file, build_models_dir, copy_function=shutil.copyfile)
             print(f"Copied model: {model_file.name}")
 
 def create_distribution_package(args):
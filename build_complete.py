@@ -9,17 +9,78 @@ import sys
 import subprocess
 import shutil
 import argparse
+import functools
+import glob
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
 
+from build import link_or_copy
+
+# Log lines Unity writes when a second editor can't start at all, as opposed to a failed build
+EDITOR_START_FAILURES = (
+    "another Unity instance is running",
+    "Multiple Unity instances cannot open the same project",
+    "No valid Unity Editor license found",
+)
+
+def sync_tree(src, dst):
+    """Make dst a copy of src, copying only files whose size or mtime differ and removing extras"""
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(dst) as entries:
+        existing = {entry.name: entry for entry in entries}
+    
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            old = existing.pop(entry.name, None)
+            if entry.is_dir(follow_symlinks=False):
+                if old is not None and not old.is_dir(follow_symlinks=False):
+                    os.remove(target)
+                sync_tree(entry.path, target)
+                continue
+            
+            if old is not None:
+                if old.is_dir(follow_symlinks=False):
+                    shutil.rmtree(target)
+                else:
+                    src_stat = entry.stat(follow_symlinks=False)
+                    dst_stat = old.stat(follow_symlinks=False)
+                    # copy2 carries the mtime over, so unchanged files match on the next run
+                    if (src_stat.st_size == dst_stat.st_size
+                            and src_stat.st_mtime_ns == dst_stat.st_mtime_ns):
+                        continue
+                    os.remove(target)
+            shutil.copy2(entry.path, target, follow_symlinks=False)
+    
+    # Anything left was deleted from the source
+    for entry in existing.values():
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.remove(entry.path)
+
 class NeuralRinkBuilder:
     def __init__(self):
         self.project_path = Path(__file__).parent
         self.unity_path = self.find_unity_executable()
         self.build_path = self.project_path / "builds"
         self.models_path = self.project_path / "Assets" / "Models"
+        self._onnx_models = self.scan_onnx_models()
+        
+    def scan_onnx_models(self):
+        """List trained .onnx models in Assets/Models"""
+        if not self.models_path.exists():
+            return []
+        return list(self.models_path.glob("*.onnx"))
         
-    def find_unity_executable(self):
-        """Find Unity executable path"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def find_unity_executable():
+        """Find Unity executable path (searched once per process)"""
         possible_paths = [
             "/Applications/Unity/Hub/Editor/*/Unity.app/Contents/MacOS/Unity",
             "C:/Program Files/Unity/Hub/Editor/*/Editor/Unity.exe",
@@ -27,12 +88,10 @@ class NeuralRinkBuilder:
         ]
         
         for path_pattern in possible_paths:
-            import glob
             matches = glob.glob(path_pattern)
             if matches:
                 # Get the latest version
-                latest = sorted(matches)[-1]
-                return latest
+                return max(matches)
                 
         return None
     
@@ -60,8 +119,7 @@ class NeuralRinkBuilder:
                 return False
                 
         # Check trained model
-        model_files = list(self.models_path.glob("*.onnx"))
-        if not model_files:
+        if not self._onnx_models:
             print("⚠️  No trained model found in Assets/Models/")
             print("Training will be skipped, but you can add models later")
             
@@ -92,52 +150,110 @@ class NeuralRinkBuilder:
             self.models_path.mkdir(exist_ok=True)
             for model_file in model_files:
                 dest = self.models_path / f"Goalie_{latest_run.name}.onnx"
-                shutil.copy2(model_file, dest)
+                # Bytes only: copyfile skips copy2's chmod/utime/xattr calls and uses sendfile on Linux
+                shutil.copyfile(model_file, dest)
                 print(f"✅ Copied model: {dest}")
+            self._onnx_models = self.scan_onnx_models()
         else:
             print("⚠️  No .onnx model files found in training results")
     
-    def build_unity_project(self, platform, target_path):
+    def prepare_project_copy(self, name):
+        """
+        Mirror the project into .build_projects/<name> so a second editor can build it
+        Unity won't open a project another editor has open. A new copy gets its Library seeded
+        from the main project so it doesn't reimport every asset; after that only changed files are synced
+        """
+        copy_path = self.project_path / ".build_projects" / name
+        copy_path.mkdir(parents=True, exist_ok=True)
+        
+        library = self.project_path / "Library"
+        if library.is_dir() and not (copy_path / "Library").exists():
+            print(f"📋 Seeding {name} project copy from the main Library (first run only)...")
+            shutil.copytree(library, copy_path / "Library", symlinks=True,
+                            ignore=shutil.ignore_patterns("*-lock", "*.lock"))
+        
+        for dir_name in ("Assets", "Packages", "ProjectSettings"):
+            src = self.project_path / dir_name
+            if src.exists():
+                # Real copies, not hardlinks: Unity may rewrite assets and .meta files in place
+                sync_tree(src, copy_path / dir_name)
+        return copy_path
+    
+    def build_unity_project(self, platform, target_path, project_path=None, prefix=""):
         """Build Unity project for specific platform"""
-        print(f"🏗️  Building for {platform}...")
+        print(f"{prefix}🏗️  Building for {platform}...")
+        project_path = project_path or self.project_path
+        log_path = self.build_log_path(platform)
         
         # Unity build command
         cmd = [
             self.unity_path,
             "-batchmode",
             "-quit",
-            "-projectPath", str(self.project_path),
+            "-projectPath", str(project_path),
             "-buildTarget", platform,
             "-executeMethod", "NeuralRink.Build.BuildScript.BuildProject",
             "-buildPath", str(target_path),
-            "-logFile", str(self.project_path / "build.log")
+            "-logFile", str(log_path)
         ]
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+            returncode = self.run_streaming(cmd, timeout=600, prefix=prefix)
             
-            if result.returncode == 0:
-                print(f"✅ {platform} build completed successfully!")
+            if returncode == 0:
+                print(f"{prefix}✅ {platform} build completed successfully!")
                 return True
             else:
-                print(f"❌ {platform} build failed!")
-                print("Error output:", result.stderr)
+                print(f"{prefix}❌ {platform} build failed!")
+                print(f"{prefix}See build log: {log_path}")
                 return False
                 
         except subprocess.TimeoutExpired:
-            print(f"❌ {platform} build timed out!")
+            print(f"{prefix}❌ {platform} build timed out!")
             return False
         except Exception as e:
-            print(f"❌ {platform} build error: {e}")
+            print(f"{prefix}❌ {platform} build error: {e}")
+            return False
+    
+    def build_log_path(self, platform):
+        """One log per platform so parallel builds don't clobber each other"""
+        return self.project_path / f"build_{platform}.log"
+    
+    def editor_failed_to_start(self, platform):
+        """True if the platform's log shows the editor never started, e.g. a second instance was refused"""
+        try:
+            log = self.build_log_path(platform).read_text(errors="replace")
+        except OSError:
             return False
+        return any(marker in log for marker in EDITOR_START_FAILURES)
+    
+    def run_streaming(self, cmd, timeout, prefix=""):
+        """Run a command, forwarding its output line by line instead of buffering it"""
+        deadline = time.monotonic() + timeout
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, bufsize=1) as proc:
+            # Reading stdout blocks until Unity exits, so enforce the timeout with a timer
+            timer = threading.Timer(timeout, proc.kill)
+            timer.start()
+            try:
+                for line in proc.stdout:
+                    # Prefix lines so concurrent builds can be told apart
+                    sys.stdout.write(prefix + line)
+            finally:
+                timer.cancel()
+            returncode = proc.wait()
+        
+        if returncode != 0 and time.monotonic() >= deadline:
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return returncode
     
     def create_build_info(self):
         """Create build information file"""
         build_info = {
             "version": "1.0.0",
-            "build_date": subprocess.check_output(["date"]).decode().strip(),
+            "build_date": datetime.now().isoformat(timespec="seconds"),
             "python_version": sys.version,
-            "training_status": "Completed" if list(self.models_path.glob("*.onnx")) else "No trained model",
+            "training_status": "Completed" if self._onnx_models else "No trained model",
             "features": [
                 "1v1 Hockey Shootout",
                 "RL-trained AI Goalie",
@@ -147,12 +263,11 @@ class NeuralRinkBuilder:
             ]
         }
         
-        import json
         with open(self.build_path / "build_info.json", "w") as f:
             json.dump(build_info, f, indent=2)
     
-    def build_all_platforms(self):
-        """Build for all supported platforms"""
+    def build_all_platforms(self, parallel=False):
+        """Build for all supported platforms, optionally running the Unity builds concurrently"""
         print("🚀 Starting complete build process...")
         
         if not self.check_prerequisites():
@@ -170,11 +285,49 @@ class NeuralRinkBuilder:
             "StandaloneOSX": "Mac"
         }
         
+        built = {}
+        sequential = list(platforms.items())
+        if parallel:
+            # The first platform builds in place; the others build from their own copy of the project
+            project_paths = {}
+            for unity_platform, display_name in platforms.items():
+                if not project_paths:
+                    project_paths[unity_platform] = self.project_path
+                    continue
+                try:
+                    project_paths[unity_platform] = self.prepare_project_copy(display_name)
+                except OSError as e:
+                    print(f"⚠️  Couldn't prepare the {display_name} project copy ({e}); building it afterwards")
+            
+            with ThreadPoolExecutor(max_workers=len(project_paths)) as executor:
+                futures = {
+                    executor.submit(self.build_unity_project, unity_platform,
+                                    self.build_path / f"NeuralRink_{platforms[unity_platform]}",
+                                    project_path, f"[{platforms[unity_platform]}] "): unity_platform
+                    for unity_platform, project_path in project_paths.items()
+                }
+                for future in as_completed(futures):
+                    built[platforms[futures[future]]] = future.result()
+            
+            # Fall back to an in-place build only where the second editor never got going
+            sequential = []
+            for unity_platform, display_name in platforms.items():
+                if display_name not in built:
+                    sequential.append((unity_platform, display_name))
+                elif (not built[display_name] and project_paths[unity_platform] != self.project_path
+                      and self.editor_failed_to_start(unity_platform)):
+                    print(f"⚠️  {display_name} editor failed to start alongside the other build; retrying on its own")
+                    sequential.append((unity_platform, display_name))
+        
+        for unity_platform, display_name in sequential:
+            built[display_name] = self.build_unity_project(
+                unity_platform, self.build_path / f"NeuralRink_{display_name}")
+        
         success_count = 0
         for unity_platform, display_name in platforms.items():
             target_path = self.build_path / f"NeuralRink_{display_name}"
             
-            if self.build_unity_project(unity_platform, target_path):
+            if built[display_name]:
                 success_count += 1
                 
                 # Create platform-specific package
@@ -199,7 +352,8 @@ class NeuralRinkBuilder:
         
         # Copy build files
         if build_path.exists():
-            shutil.copytree(build_path, package_path / "Game", dirs_exist_ok=True)
+            shutil.copytree(build_path, package_path / "Game", dirs_exist_ok=True,
+                            copy_function=link_or_copy)
         
         # Copy additional files
         additional_files = [
@@ -242,6 +396,8 @@ def main():
                        help="Build for all platforms (same as --platform all)")
     parser.add_argument("--skip-model", action="store_true",
                        help="Skip copying trained model")
+    parser.add_argument("--parallel", action="store_true",
+                       help="Build all platforms concurrently, each from its own copy of the project")
     
     args = parser.parse_args()
     
@@ -252,7 +408,7 @@ def main():
     builder = NeuralRinkBuilder()
     
     if args.platform == "all":
-        success = builder.build_all_platforms()
+        success = builder.build_all_platforms(parallel=args.parallel)
     else:
         # Single platform build
         if not builder.check_prerequisites():
@@ -6,44 +6,143 @@ Shows current progress of training, Unity setup, and builds
 
 import os
 import sys
+import argparse
+import importlib.metadata
+import importlib.util
+import selectors
+import time
 from pathlib import Path
 import subprocess
 
+import _status_cache
+
+TRAINING_SCRIPT = "alternative_train.py"
+
+def is_training_command(args, needle):
+    """True if one of the command's arguments ends with the training script name"""
+    # Matching a whole argument ignores shells that merely mention the script
+    return any(arg.endswith(needle) for arg in args)
+
+def find_training_pids():
+    """Find PIDs of running training processes"""
+    needle = TRAINING_SCRIPT.encode()
+    if sys.platform.startswith("linux"):
+        pids = scan_proc_cmdlines(needle)
+    else:
+        pids = scan_ps_commands(needle)
+    # Neither this checker nor the shell that launched it is ever the trainer
+    return [pid for pid in pids if pid not in (os.getpid(), os.getppid())]
+
+def scan_ps_commands(needle):
+    """Fallback for platforms without /proc: search ps output as raw bytes, no decoding"""
+    result = subprocess.run(['ps', '-axo', 'pid=,args='], capture_output=True)
+    if needle not in result.stdout:
+        return []
+    
+    pids = []
+    for line in result.stdout.splitlines():
+        if needle not in line:
+            continue
+        # ps joins argv with spaces, so whitespace-separated words are the closest to arguments
+        pid, *args = line.split()
+        if is_training_command(args, needle):
+            pids.append(int(pid))
+    return pids
+
+def scan_proc_cmdlines(needle):
+    """Scan /proc/<pid>/cmdline directly instead of forking ps"""
+    pids = []
+    with os.scandir("/proc") as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                # Unbuffered binary read: one read syscall, no decoding
+                with open(f"/proc/{entry.name}/cmdline", "rb", buffering=0) as f:
+                    cmdline = f.read()
+            except OSError:
+                # Process exited while scanning
+                continue
+            if needle in cmdline and is_training_command(cmdline.split(b"\0"), needle):
+                pids.append(int(entry.name))
+    return pids
+
+def wait_for_training(pids):
+    """Block until the given training processes exit"""
+    if not hasattr(os, "pidfd_open"):
+        # No pidfds (non-Linux or Python < 3.9): fall back to re-scanning
+        while any(pid in pids for pid in find_training_pids()):
+            time.sleep(5)
+        return
+    
+    # A pidfd becomes readable when its process exits, so the wait costs no wake-ups
+    with selectors.DefaultSelector() as sel:
+        for pid in pids:
+            try:
+                sel.register(os.pidfd_open(pid), selectors.EVENT_READ)
+            except ProcessLookupError:
+                # Already exited
+                continue
+        while sel.get_map():
+            for key, _ in sel.select():
+                sel.unregister(key.fileobj)
+                os.close(key.fileobj)
+
+def find_latest_run(results_path):
+    """Return the DirEntry of the most recently modified run directory, or None"""
+    latest, latest_mtime = None, None
+    try:
+        with os.scandir(results_path) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                # One stat per run; no second pass over a list
+                mtime = entry.stat().st_mtime
+                if latest is None or mtime > latest_mtime:
+                    latest, latest_mtime = entry, mtime
+    except FileNotFoundError:
+        return None
+    return latest
+
 def check_training_status():
     """Check if training is running and show progress"""
     print("🏒 Neural Rink Project Status")
     print("=" * 50)
     
+    status = {
+        "running": False,
+        "completed": _status_cache.isdir("results/neural_rink_full"),
+        "latest_run": None
+    }
+    
     # Check if training is running
     try:
-        result = subprocess.run(['ps', 'aux'], capture_output=True, text=True)
-        if 'alternative_train.py' in result.stdout:
+        if find_training_pids():
+            status["running"] = True
             print("✅ Training: RUNNING (100k steps in progress)")
             
             # Check results directory
-            results_path = Path("results")
-            if results_path.exists():
-                training_runs = [d for d in results_path.iterdir() if d.is_dir()]
-                if training_runs:
-                    latest_run = max(training_runs, key=lambda x: x.stat().st_mtime)
-                    print(f"📊 Latest run: {latest_run.name}")
-                    
-                    # Check for model files
-                    model_files = list(latest_run.glob("*.zip"))
-                    if model_files:
-                        print(f"🤖 Model files: {len(model_files)} found")
-                    else:
-                        print("⏳ Model files: Training in progress...")
+            latest_run = find_latest_run("results")
+            if latest_run:
+                status["latest_run"] = latest_run.name
+                print(f"📊 Latest run: {latest_run.name}")
+                
+                # Check for model files
+                model_count = _status_cache.count_files(latest_run.path, ".zip")
+                if model_count:
+                    print(f"🤖 Model files: {model_count} found")
+                else:
+                    print("⏳ Model files: Training in progress...")
         else:
             print("⏸️  Training: NOT RUNNING")
             
             # Check for completed training
             results_path = Path("results/neural_rink_full")
-            if results_path.exists():
-                model_files = list(results_path.glob("*.zip"))
-                if model_files:
+            if status["completed"]:
+                model_count = _status_cache.count_files(results_path, ".zip")
+                if model_count:
                     print("✅ Training: COMPLETED (neural_rink_full)")
-                    print(f"🤖 Model files: {len(model_files)} found")
+                    print(f"🤖 Model files: {model_count} found")
                 else:
                     print("✅ Training: COMPLETED (neural_rink_full) - No model files yet")
             else:
@@ -51,6 +150,8 @@ def check_training_status():
                 
     except Exception as e:
         print(f"❌ Training: Error checking status - {e}")
+    
+    return status
 
 def check_unity_setup():
     """Check Unity setup status"""
@@ -65,10 +166,9 @@ def check_unity_setup():
         "Assets/Models/Goalie_Final.zip"
     ]
     
-    found_files = 0
-    for file_path in unity_files:
-        if Path(file_path).exists():
-            found_files += 1
+    absent = _status_cache.missing(unity_files)
+    present = [f for f in unity_files if f not in absent]
+    found_files = len(present)
     
     if found_files == len(unity_files):
         print("✅ Unity Setup: COMPLETE (all files present)")
@@ -78,63 +178,71 @@ def check_unity_setup():
         print(f"🚧 Unity Setup: PARTIAL ({found_files}/{len(unity_files)} files)")
     else:
         print("❌ Unity Setup: NOT STARTED")
+    
+    return {
+        "found_files": found_files,
+        "total_files": len(unity_files),
+        "scenes_present": any(f.endswith(".unity") for f in present)
+    }
 
 def check_build_status():
     """Check build status"""
     print("\n🏗️  Build Status:")
     
-    builds_path = Path("builds")
-    if builds_path.exists():
-        build_dirs = [d for d in builds_path.iterdir() if d.is_dir()]
-        if build_dirs:
-            print(f"✅ Builds: {len(build_dirs)} packages found")
-            for build_dir in build_dirs:
-                print(f"   📦 {build_dir.name}")
-        else:
-            print("⏳ Builds: Directory exists but no packages")
-    else:
+    status = {"exists": False, "packages": []}
+    
+    try:
+        # d_type from the directory listing answers is_dir without a stat per entry
+        with os.scandir("builds") as entries:
+            status["packages"] = [e.name for e in entries if e.is_dir(follow_symlinks=False)]
+        status["exists"] = True
+    except FileNotFoundError:
+        pass
+    
+    if not status["exists"]:
         print("❌ Builds: NOT STARTED")
+    elif status["packages"]:
+        print(f"✅ Builds: {len(status['packages'])} packages found")
+        for name in status["packages"]:
+            print(f"   📦 {name}")
+    else:
+        print("⏳ Builds: Directory exists but no packages")
+    
+    return status
 
 def check_dependencies():
     """Check if required dependencies are installed"""
     print("\n📦 Dependencies Status:")
     
-    try:
-        import stable_baselines3
-        print("✅ Stable-Baselines3: INSTALLED")
-    except ImportError:
-        print("❌ Stable-Baselines3: NOT INSTALLED")
-    
-    try:
-        import torch
-        print("✅ PyTorch: INSTALLED")
-    except ImportError:
-        print("❌ PyTorch: NOT INSTALLED")
+    # find_spec locates the package without executing it (importing torch alone takes seconds)
+    dependencies = [
+        ("stable_baselines3", "stable-baselines3", "Stable-Baselines3"),
+        ("torch", "torch", "PyTorch"),
+        ("tensorboard", "tensorboard", "TensorBoard"),
+    ]
     
-    try:
-        import tensorboard
-        print("✅ TensorBoard: INSTALLED")
-    except ImportError:
-        print("❌ TensorBoard: NOT INSTALLED")
+    for module_name, dist_name, label in dependencies:
+        if importlib.util.find_spec(module_name) is None:
+            print(f"❌ {label}: NOT INSTALLED")
+            continue
+        try:
+            version = importlib.metadata.version(dist_name)
+            print(f"✅ {label}: INSTALLED ({version})")
+        except importlib.metadata.PackageNotFoundError:
+            print(f"✅ {label}: INSTALLED")
 
-def show_next_steps():
-    """Show recommended next steps"""
+def show_next_steps(training_status, unity_status, build_status):
+    """Show recommended next steps from the results of the earlier checks"""
     print("\n🎯 Recommended Next Steps:")
     
     # Check training status
-    results_path = Path("results/neural_rink_full")
-    if not results_path.exists():
+    if not training_status["completed"]:
         print("1. ⏳ Wait for training to complete (100k steps)")
     else:
         print("1. ✅ Training completed - ready for Unity setup")
     
     # Check Unity setup
-    unity_files = [
-        "Assets/Scenes/Training.unity",
-        "Assets/Scenes/Play.unity"
-    ]
-    
-    if not any(Path(f).exists() for f in unity_files):
+    if not unity_status["scenes_present"]:
         print("2. 🎮 Start Unity setup:")
         print("   - Open Unity Hub")
         print("   - Create new 3D project")
@@ -144,8 +252,7 @@ def show_next_steps():
         print("2. ✅ Unity setup in progress")
     
     # Check builds
-    builds_path = Path("builds")
-    if not builds_path.exists():
+    if not build_status["exists"]:
         print("3. 🏗️  Ready for building:")
         print("   - Complete Unity setup first")
         print("   - Run: python build_complete.py --all-platforms")
@@ -153,11 +260,26 @@ def show_next_steps():
         print("3. ✅ Builds available")
 
 def main():
-    check_training_status()
-    check_unity_setup()
-    check_build_status()
+    parser = argparse.ArgumentParser(description="Show Neural Rink project status")
+    parser.add_argument("--wait", action="store_true",
+                       help="Wait for a running training process to finish before reporting")
+    _status_cache.add_cache_argument(parser)
+    args = parser.parse_args()
+    
+    if args.wait:
+        pids = find_training_pids()
+        if pids:
+            print(f"⏳ Waiting for training to finish (PID {', '.join(map(str, pids))})...")
+            wait_for_training(pids)
+            print("✅ Training process exited\n")
+    
+    _status_cache.build_index(cache_file=args.cache_file)
+    
+    training_status = check_training_status()
+    unity_status = check_unity_setup()
+    build_status = check_build_status()
     check_dependencies()
-    show_next_steps()
+    show_next_steps(training_status, unity_status, build_status)
     
     print("\n" + "=" * 50)
     print("📚 For detailed instructions, see:")
@@ -3,32 +3,58 @@
 Fix Unity compilation errors by installing required packages
 """
 
+import functools
+import os
+import re
 import subprocess
 import sys
 from pathlib import Path
 
-def run_unity_command(command):
+UNITY_HUB_EDITORS = "/Applications/Unity/Hub/Editor"
+UNITY_STANDALONE = "/Applications/Unity/Unity.app/Contents/MacOS/Unity"
+UNITY_TIMEOUT = 600  # Seconds; a package request that never completes must not hang the script
+
+def _version_key(version):
+    """Sort key for Unity versions like 6000.2.5f1 (numeric, so 6000 > 2022)"""
+    return tuple(int(part) for part in re.findall(r"\d+", version))
+
+@functools.lru_cache(maxsize=1)
+def find_unity_executable():
+    """Find the newest Unity editor installed through Unity Hub (searched once per process)"""
+    # One directory listing covers every Hub-installed version
+    try:
+        with os.scandir(UNITY_HUB_EDITORS) as entries:
+            versions = [entry.name for entry in entries if entry.is_dir()]
+    except OSError:
+        versions = []
+    
+    if versions:
+        latest = max(versions, key=_version_key)
+        unity_exe = f"{UNITY_HUB_EDITORS}/{latest}/Unity.app/Contents/MacOS/Unity"
+        if os.access(unity_exe, os.X_OK):
+            return unity_exe
+    
+    # Standalone install outside the Hub
+    if os.access(UNITY_STANDALONE, os.X_OK):
+        return UNITY_STANDALONE
+    return None
+
+def run_unity_command(command, quit=True, ignore_compiler_errors=False):
     """Run Unity command line"""
     try:
-        # Try to find Unity installation
-        unity_paths = [
-            "/Applications/Unity/Hub/Editor/2022.3.0f1/Unity.app/Contents/MacOS/Unity",
-            "/Applications/Unity/Hub/Editor/6000.2.5f1/Unity.app/Contents/MacOS/Unity",
-            "/Applications/Unity/Unity.app/Contents/MacOS/Unity"
-        ]
-        
-        unity_exe = None
-        for path in unity_paths:
-            if Path(path).exists():
-                unity_exe = path
-                break
+        unity_exe = find_unity_executable()
         
         if not unity_exe:
             print("❌ Unity not found. Please install Unity 6000.2.5f1")
             return False
             
-        cmd = [unity_exe, "-batchmode", "-quit", "-projectPath", str(Path.cwd()), "-executeMethod", command]
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        cmd = [unity_exe, "-batchmode", "-projectPath", str(Path.cwd()), "-executeMethod", command]
+        if quit:
+            cmd.insert(2, "-quit")
+        if ignore_compiler_errors:
+            # Otherwise batchmode aborts before -executeMethod while Assembly-CSharp is broken
+            cmd.insert(2, "-ignorecompilererrors")
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=UNITY_TIMEOUT)
         
         if result.returncode == 0:
             print(f"✅ {command} completed successfully")
@@ -37,6 +63,9 @@ def run_unity_command(command):
             print(f"❌ {command} failed: {result.stderr}")
             return False
             
+    except subprocess.TimeoutExpired:
+        print(f"❌ {command} timed out after {UNITY_TIMEOUT}s")
+        return False
     except Exception as e:
         print(f"❌ Error running Unity command: {e}")
         return False
@@ -45,19 +74,16 @@ def main():
     print("🔧 Fixing Unity Compilation Errors...")
     print("=" * 50)
     
-    # Step 1: Install TextMeshPro
-    print("\n1. Installing TextMeshPro...")
-    if run_unity_command("UnityEditor.TextMeshPro.Editor.TextMeshProEditor.ImportTextMeshProEssentials"):
+    # Both fixes run in one Unity session (Assets/Editor/FixUnityErrors.cs) to pay the
+    # editor's cold start once. The method exits Unity itself after the async package add.
+    # The game scripts don't compile until these packages exist, hence ignore_compiler_errors.
+    print("\n1. Installing TextMeshPro and Input System...")
+    if run_unity_command("NeuralRink.Editor.FixUnityErrors.Run", quit=False,
+                         ignore_compiler_errors=True):
         print("✅ TextMeshPro installed")
-    else:
-        print("❌ Failed to install TextMeshPro")
-    
-    # Step 2: Install Input System
-    print("\n2. Installing Input System...")
-    if run_unity_command("UnityEditor.PackageManager.Client.Add"):
         print("✅ Input System installed")
     else:
-        print("❌ Failed to install Input System")
+        print("❌ Failed to install TextMeshPro / Input System")
     
     print("\n🎯 Next Steps:")
     print("1. Close Unity completely")
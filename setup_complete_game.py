@@ -5,11 +5,34 @@ This script prepares everything for Unity to create a fully playable game.
 """
 
 import os
+import argparse
 import sys
 import shutil
 import zipfile
 from pathlib import Path
 
+import _status_cache
+
+def copy_model(src, dst):
+    """Copy src to dst inside the kernel where supported, keeping metadata like copy2"""
+    if not hasattr(os, "copy_file_range"):
+        shutil.copy2(src, dst)
+        return
+    
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError:
+        # e.g. EXDEV on older kernels or filesystems without support
+        shutil.copy2(src, dst)
+        return
+    shutil.copystat(src, dst)
+
 def setup_ml_model():
     """Deploy the best trained ML model."""
     print("🤖 Deploying best ML model...")
@@ -25,11 +48,14 @@ def setup_ml_model():
     best_size = 0
     
     for path in model_paths:
-        if os.path.exists(path):
-            size = os.path.getsize(path)
-            if size > best_size:
-                best_size = size
-                best_model = path
+        # One stat gives both existence and size
+        try:
+            size = os.stat(path).st_size
+        except FileNotFoundError:
+            continue
+        if size > best_size:
+            best_size = size
+            best_model = path
     
     if best_model:
         # Ensure Models directory exists
@@ -37,7 +63,7 @@ def setup_ml_model():
         
         # Copy best model
         dest_path = "Assets/Models/DeployedGoalieModel.zip"
-        shutil.copy2(best_model, dest_path)
+        copy_model(best_model, dest_path)
         
         print(f"✅ Best ML model deployed: {best_model} ({best_size:,} bytes)")
         print(f"   → {dest_path}")
@@ -53,10 +79,8 @@ def verify_physics_materials():
     materials_dir = "Assets/Physics Materials"
     required_materials = ["Handle.physicMaterial", "Puck.physicMaterial", "Wall.physicMaterial"]
     
-    missing = []
-    for material in required_materials:
-        if not os.path.exists(os.path.join(materials_dir, material)):
-            missing.append(material)
+    missing = [os.path.basename(path) for path in _status_cache.missing(
+        os.path.join(materials_dir, material) for material in required_materials)]
     
     if missing:
         print(f"⚠️  Missing physics materials: {', '.join(missing)}")
@@ -81,10 +105,8 @@ def verify_scripts():
         "Assets/Scripts/Setup/InstantGameSetup.cs"
     ]
     
-    missing = []
-    for script in required_scripts:
-        if not os.path.exists(script):
-            missing.append(script)
+    # Answered together from the shared index (or one listing per folder without it)
+    missing = _status_cache.missing(required_scripts)
     
     if missing:
         print(f"❌ Missing scripts: {', '.join(missing)}")
@@ -98,11 +120,7 @@ def verify_scenes():
     print("🎬 Verifying game scenes...")
     
     scenes = ["Assets/Scenes/Training.unity", "Assets/Scenes/Play.unity"]
-    missing = []
-    
-    for scene in scenes:
-        if not os.path.exists(scene):
-            missing.append(scene)
+    missing = _status_cache.missing(scenes)
     
     if missing:
         print(f"❌ Missing scenes: {', '.join(missing)}")
@@ -173,17 +191,29 @@ If you prefer manual setup:
 **Your game is 95% complete - just run the Unity setup and start playing!** 🎉
 """
     
-    with open("UNITY_SETUP_INSTRUCTIONS.md", "w") as f:
-        f.write(instructions)
+    # Raw fd write: no TextIOWrapper/encoder, and UTF-8 regardless of locale (the text has emoji)
+    data = instructions.encode("utf-8")
+    fd = os.open("UNITY_SETUP_INSTRUCTIONS.md", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
     
     print("✅ Unity setup instructions created")
 
 def main():
+    parser = argparse.ArgumentParser(description="Prepare Neural Rink for the Unity setup")
+    _status_cache.add_cache_argument(parser)
+    args = parser.parse_args()
+    
     print("🏒 Neural Rink - Complete Game Setup Preparation")
     print("=" * 60)
     
+    _status_cache.build_index(cache_file=args.cache_file)
+    
     # Verify we're in the right directory
-    if not os.path.exists("Assets/Scripts"):
+    if not _status_cache.isdir("Assets/Scripts"):
         print("❌ Error: Run this from the Hockey RL Demo directory")
         return
     
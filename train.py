@@ -16,8 +16,9 @@ import argparse
 import os
 import sys
 import subprocess
+import shutil
 import json
-import time
+from datetime import datetime
 from pathlib import Path
 
 def main():
@@ -74,9 +75,15 @@ def main():
     print(f"Command: {' '.join(cmd)}")
     print("-" * 50)
     
+    # Run training. With an absolute executable path and close_fds=False, CPython
+    # starts the child via posix_spawn instead of fork()ing this whole process
+    process = subprocess.Popen([shutil.which(cmd[0])] + cmd[1:], close_fds=False)
+    
     try:
-        # Run training
-        process = subprocess.run(cmd, check=True, capture_output=False)
+        # wait() without a timeout blocks in waitpid(), so there is no polling loop
+        returncode = process.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd)
         
         print("-" * 50)
         print("Training completed successfully!")
@@ -88,7 +95,9 @@ def main():
         print(f"Training failed with exit code: {e.returncode}")
         sys.exit(1)
     except KeyboardInterrupt:
+        # The child got the same SIGINT; let ML-Agents save its checkpoint and exit
         print("\nTraining interrupted by user")
+        process.wait()
         sys.exit(1)
 
 def validate_environment():
@@ -101,15 +110,8 @@ def validate_environment():
         print("Please run this script from the Unity project root directory.")
         return False
     
-    # Check if mlagents-learn is available
-    try:
-        result = subprocess.run(['mlagents-learn', '--help'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode != 0:
-            print("ERROR: mlagents-learn command not found!")
-            print("Please install Unity ML-Agents: pip install mlagents")
-            return False
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+    # Check if mlagents-learn is available (a PATH lookup, not a multi-second --help run)
+    if shutil.which('mlagents-learn') is None:
         print("ERROR: mlagents-learn command not found!")
         print("Please install Unity ML-Agents: pip install mlagents")
         return False
@@ -192,7 +194,7 @@ def generate_training_report(args):
         'config_file': args.config,
         'num_environments': args.num_envs,
         'max_steps': args.max_steps,
-        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
         'python_version': sys.version,
         'platform': sys.platform
     }
@@ -217,7 +219,6 @@ def copy_best_model(run_id):
             
             # Copy to models directory
             dest_path = models_dir / f"{run_id}_best.onnx"
-            import shutil
             shutil.copy2(best_model, dest_path)
             print(f"Best model copied to: {dest_path}")
 
@@ -4,11 +4,13 @@ Verify that the Neural Rink game is ready to run in Unity
 """
 
 import os
-from pathlib import Path
+import argparse
+
+import _status_cache
 
 def check_file_exists(file_path, description):
     """Check if a file exists and report status"""
-    if Path(file_path).exists():
+    if _status_cache.exists(file_path):
         print(f"✅ {description}: {file_path}")
         return True
     else:
@@ -17,20 +19,27 @@ def check_file_exists(file_path, description):
 
 def check_directory_exists(dir_path, description):
     """Check if a directory exists and report status"""
-    if Path(dir_path).exists() and Path(dir_path).is_dir():
-        files = list(Path(dir_path).glob("*"))
-        print(f"✅ {description}: {dir_path} ({len(files)} files)")
+    if _status_cache.isdir(dir_path):
+        # Skip hidden entries like glob("*") did
+        count = sum(1 for name in _status_cache.listdir(dir_path) if not name.startswith("."))
+        print(f"✅ {description}: {dir_path} ({count} files)")
         return True
     else:
         print(f"❌ {description}: {dir_path} - MISSING")
         return False
 
 def main():
+    parser = argparse.ArgumentParser(description="Verify that Neural Rink is ready to run in Unity")
+    _status_cache.add_cache_argument(parser)
+    args = parser.parse_args()
+    
     print("🏒 Neural Rink - Game Readiness Verification")
     print("=" * 60)
     
     all_good = True
     
+    _status_cache.build_index(cache_file=args.cache_file)
+    
     # Check Unity project structure
     print("\n📁 Unity Project Structure:")
     all_good &= check_directory_exists("Assets", "Assets folder")
@@ -65,9 +74,9 @@ def main():
     
     # Check training results
     print("\n🎯 Training Results:")
-    if Path("results/neural_rink_full").exists():
-        model_files = list(Path("results/neural_rink_full").glob("*.zip"))
-        print(f"✅ Training completed: {len(model_files)} model files")
+    if _status_cache.isdir("results/neural_rink_full"):
+        model_count = _status_cache.count_files("results/neural_rink_full", ".zip")
+        print(f"✅ Training completed: {model_count} model files")
     else:
         print("⚠️  Training results not found (optional)")
     